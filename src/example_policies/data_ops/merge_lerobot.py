@@ -20,12 +20,16 @@ from example_policies.data_ops.merger.lerobot_pseudo_dataset import LerobotPseud
 from example_policies.data_ops.merger.merging_manager import MergingManager
 
 
-def merge_datasets(dataset_paths: List[pathlib.Path], output_path: pathlib.Path):
-    out_dataset = MergingManager(output_path)
+def merge_datasets(
+    dataset_paths: List[pathlib.Path],
+    output_path: pathlib.Path,
+    link_videos: bool = False,
+):
+    out_dataset = MergingManager(output_path, link_videos=link_videos)
 
     for data_path in dataset_paths:
+        # The constructor already loads the metadata; don't parse it twice.
         dataset = LerobotPseudoDataset(data_path)
-        dataset.read_meta_info()
         out_dataset.add_dataset(dataset)
 
 
@@ -36,8 +40,13 @@ if __name__ == "__main__":
 
     # Single Output path
     parser.add_argument("--output", type=str, help="Path to the output file")
+    parser.add_argument(
+        "--link-videos",
+        action="store_true",
+        help="Hardlink videos instead of copying them (source videos must not be modified afterwards)",
+    )
 
     args = parser.parse_args()
     dataset_paths = [pathlib.Path(p) for p in args.paths]
     output_path = pathlib.Path(args.output)
-    merge_datasets(dataset_paths, output_path)
+    merge_datasets(dataset_paths, output_path, link_videos=args.link_videos)
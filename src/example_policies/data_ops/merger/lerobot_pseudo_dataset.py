@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import pathlib
 from typing import Dict
 
@@ -48,7 +49,11 @@ class LerobotPseudoDataset:
 
     def read_video_paths(self):
         video_path = self.root / c.VIDEO_DIR
-        self.video_paths = [p for p in video_path.iterdir() if p.is_dir()]
+        # scandir reuses the directory entry type instead of stat'ing every path
+        with os.scandir(video_path) as entries:
+            self.video_paths = [
+                video_path / entry.name for entry in entries if entry.is_dir()
+            ]
 
     def read_episode_parquet(self, ep_idx: int):
         return pd.read_parquet(
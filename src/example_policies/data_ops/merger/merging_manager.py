@@ -12,17 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import pathlib
 import shutil
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 
 from . import constants as c
 from .lerobot_pseudo_dataset import LerobotPseudoDataset
 from .meta_manager import MetaManager
 
+# Video copies are independent and I/O-bound, so they are overlapped on a thread pool.
+VIDEO_COPY_WORKERS = (os.cpu_count() or 1) * 2
+
 
 class MergingManager:
-    def __init__(self, output_path: pathlib.Path):
+    def __init__(self, output_path: pathlib.Path, link_videos: bool = False):
         self.output_path = output_path
+        # Hardlink source videos into the merged dataset instead of copying bytes.
+        # Only safe while the source videos are never modified in place.
+        self.link_videos = link_videos
         self.create_new_dataset_structure()
 
         self.episode_counter = 0
@@ -45,9 +53,20 @@ class MergingManager:
         self.create_video_dirs(dataset)
         self.add_tasks(dataset)
         frame_offset = 0
-        for ep in dataset.meta.episodes:
-            frame_offset += self.add_episode_parquet(ep, dataset)
-            self.add_videos(ep, dataset)
+        with ThreadPoolExecutor(max_workers=VIDEO_COPY_WORKERS) as pool:
+            video_jobs = []
+            try:
+                for ep in dataset.meta.episodes:
+                    # Fail fast on a copy error instead of rewriting every parquet first.
+                    video_jobs = _pop_finished_jobs(video_jobs)
+                    frame_offset += self.add_episode_parquet(ep, dataset)
+                    video_jobs.append(pool.submit(self.add_videos, ep, dataset))
+                wait(video_jobs, return_when=FIRST_EXCEPTION)
+                _pop_finished_jobs(video_jobs)
+            except BaseException:
+                for job in video_jobs:
+                    job.cancel()
+                raise
 
         self.add_meta(dataset)
         self.dataset_frame_offset += frame_offset
@@ -112,18 +131,22 @@ class MergingManager:
         orig_ep_idx = episode_meta_dict["episode_index"]
         video_paths = dataset.video_paths
 
+        # File names and the output root are shared by all cameras of the episode.
+        src_name = f"episode_{orig_ep_idx:06d}.mp4"
+        dst_name = f"episode_{orig_ep_idx + self.dataset_episode_offset:06d}.mp4"
+        video_out_dir = self.output_path / c.VIDEO_DIR
+
         for camera in video_paths:
-            cam_name = camera.name
+            src = camera / src_name
+            dst = video_out_dir / camera.name / dst_name
 
-            video_file = camera / f"episode_{orig_ep_idx:06d}.mp4"
-
-            src = camera / f"episode_{orig_ep_idx:06d}.mp4"
-            dst = (
-                self.output_path
-                / c.VIDEO_DIR
-                / cam_name
-                / f"episode_{orig_ep_idx + self.dataset_episode_offset:06d}.mp4"
-            )
+            if self.link_videos:
+                try:
+                    os.link(src, dst)
+                    continue
+                except OSError:
+                    # Cross-device or unsupported filesystem: fall back to copying.
+                    pass
 
             # Copy (not move); overwrite if already present.
             shutil.copy2(src, dst)
@@ -136,3 +159,14 @@ class MergingManager:
 
     def _update_task_idx(self, old_id: int, dataset: LerobotPseudoDataset):
         return self.task_map[dataset.id_2_task[old_id]]
+
+
+def _pop_finished_jobs(jobs: list) -> list:
+    """Re-raise the error of any finished job and return the unfinished ones."""
+    pending = []
+    for job in jobs:
+        if job.done():
+            job.result()
+        else:
+            pending.append(job)
+    return pending
@@ -15,16 +15,26 @@
 from __future__ import annotations
 
 import json
+import math
 import pathlib
 from typing import Dict, List
 
 from . import constants as c
 
+# orjson (the `fast-json` extra) speeds up the large JSONL metadata files roughly 2x.
+# With it installed, lines are written with compact separators and raw UTF-8;
+# records holding NaN/Infinity keep the stdlib formatting, since orjson cannot
+# represent them. Both styles load back to the same values.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class MetaManager:
     def __init__(self):
         self.blacklist: List[int] = []
-        self.episode_mapping: dict = {}
+        self.episode_mapping: Dict[int, str] = {}
         self.stats: List[dict] = []
         self.episodes: List[dict] = []
         self.pipeline_config: dict = {}
@@ -38,7 +48,11 @@ class MetaManager:
             raise FileNotFoundError(f"Meta directory {meta_path} does not exist.")
 
         self.blacklist = load_json(meta_path / c.BLACKLIST_FILE)
-        self.episode_mapping = load_json(meta_path / c.EPISODE_MAPPING_FILE)
+        # JSON object keys are strings; keep the mapping int-keyed in memory.
+        self.episode_mapping = {
+            int(idx): path
+            for idx, path in load_json(meta_path / c.EPISODE_MAPPING_FILE).items()
+        }
         self.stats = load_jsonl(meta_path / c.STATS_FILE)
         self.episodes = load_jsonl(meta_path / c.EPISODES_FILE)
         self.pipeline_config = load_json(meta_path / c.PIPELINE_CONFIG_FILE)
@@ -76,7 +90,6 @@ class MetaManager:
 
     def _extend_episode_mapping(self, dataset_meta: MetaManager, episode_offset: int):
         for idx, path in dataset_meta.episode_mapping.items():
-            idx = int(idx)
             self.episode_mapping[idx + episode_offset] = path
 
     def _extend_stats(self, dataset_meta: MetaManager, episode_offset: int):
@@ -120,9 +133,9 @@ def load_json(path: pathlib.Path) -> dict:
 
 def load_jsonl(path: pathlib.Path) -> dict:
     data = []
-    with open(path, "r") as f:
+    with open(path, "rb") as f:
         for line in f:
-            data.append(json.loads(line))
+            data.append(_loads_line(line))
     return data
 
 
@@ -132,6 +145,33 @@ def write_json(data: dict, path: pathlib.Path) -> None:
 
 
 def write_jsonl(data: List[dict], path: pathlib.Path) -> None:
-    with open(path, "w") as f:
+    with open(path, "wb") as f:
         for item in data:
-            f.write(json.dumps(item) + "\n")
+            f.write(_dumps_line(item))
+
+
+def _loads_line(line: bytes):
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens written by the stdlib json.
+            pass
+    return json.loads(line)
+
+
+def _dumps_line(item: dict) -> bytes:
+    # orjson silently writes NaN/Infinity as null, so keep those on the stdlib path.
+    if orjson is not None and _is_finite(item):
+        return orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(item) + "\n").encode("utf-8")
+
+
+def _is_finite(obj) -> bool:
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if isinstance(obj, dict):
+        return all(_is_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_is_finite(v) for v in obj)
+    return True
@@ -224,6 +224,9 @@ class EpisodeReviewer:
         # Load existing blacklist
         self.blacklist = self.load_blacklist()
 
+        # Scan video directories once instead of stat'ing every episode file
+        self.video_names = self.scan_video_dirs()
+
         # Find max episode number
         self.max_episode = self.find_max_episode()
 
@@ -262,18 +265,33 @@ class EpisodeReviewer:
             print(f"Error saving blacklist: {e}")
             return False
 
+    def scan_video_dirs(self):
+        """Collect the episode video file names present in each video directory"""
+        video_names = {}
+        for video_dir in self.video_dirs:
+            try:
+                with os.scandir(self.video_base / video_dir) as entries:
+                    video_names[video_dir] = {
+                        entry.name
+                        for entry in entries
+                        if entry.name.startswith("episode_")
+                        and entry.name.endswith(".mp4")
+                        and entry.is_file()
+                    }
+            except FileNotFoundError:
+                video_names[video_dir] = set()
+        return video_names
+
     def find_max_episode(self):
         """Find the highest episode number"""
         max_ep = -1
-        for video_dir in self.video_dirs:
-            dir_path = self.video_base / video_dir
-            if dir_path.exists():
-                for video_file in dir_path.glob("episode_*.mp4"):
-                    try:
-                        ep_num = int(video_file.stem.split("_")[1])
-                        max_ep = max(max_ep, ep_num)
-                    except (ValueError, IndexError):
-                        continue
+        for names in self.video_names.values():
+            for name in names:
+                try:
+                    ep_num = int(Path(name).stem.split("_")[1])
+                    max_ep = max(max_ep, ep_num)
+                except (ValueError, IndexError):
+                    continue
         return max_ep
 
     def get_episode_videos(self, episode_num):
@@ -282,9 +300,8 @@ class EpisodeReviewer:
         episode_name = f"episode_{episode_num:06d}.mp4"
 
         for video_dir in self.video_dirs:
-            video_path = self.video_base / video_dir / episode_name
-            if video_path.exists():
-                videos.append((video_path, video_dir))
+            if episode_name in self.video_names[video_dir]:
+                videos.append((self.video_base / video_dir / episode_name, video_dir))
 
         return videos
 
@@ -82,6 +82,10 @@ def filter_episode_paths(
     if len(operator_blacklist) == 0 and len(rating_whitelist) == 0:
         return episode_paths
 
+    # Use sets for efficient lookup of operators and ratings.
+    operator_blacklist = frozenset(operator_blacklist)
+    rating_whitelist = frozenset(rating_whitelist)
+
     filtered_paths = []
     for ep_path in episode_paths:
         parts = ep_path.stem.split("_")
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import argparse
+import queue
+import threading
 import time
 from pathlib import Path
 
@@ -45,18 +47,79 @@ class FakeConfig:
         )
         self.output_features["action"] = np.asarray(m["features"]["action"]["names"])
 
-    def get_tcp_from_state(self, state: np.ndarray) -> np.ndarray:
         state_names = []
         state_names.extend([f"tcp_left_pos_{i}" for i in "xyz"])
         state_names.extend([f"tcp_left_quat_{i}" for i in "xyzw"])
         state_names.extend([f"tcp_right_pos_{i}" for i in "xyz"])
         state_names.extend([f"tcp_right_quat_{i}" for i in "xyzw"])
 
-        state_indices = [
-            np.where(self.input_features["observation.state"] == name)[0][0]
-            for name in state_names
+        # Resolve the TCP indices once instead of searching the names on every call.
+        # Joint-only datasets have no TCP pose; only TCP replays need the indices.
+        state_name_to_idx = {
+            name: idx
+            for idx, name in enumerate(m["features"]["observation.state"]["names"])
+        }
+        self._missing_tcp_names = [
+            name for name in state_names if name not in state_name_to_idx
         ]
-        return state[:, state_indices]
+        self._tcp_state_indices = None
+        if not self._missing_tcp_names:
+            self._tcp_state_indices = np.array(
+                [state_name_to_idx[name] for name in state_names], dtype=np.intp
+            )
+
+    def get_tcp_from_state(self, state: np.ndarray) -> np.ndarray:
+        if self._tcp_state_indices is None:
+            raise ValueError(
+                f"observation.state has no TCP pose, missing: {self._missing_tcp_names}"
+            )
+        return state[..., self._tcp_state_indices]
+
+
+class _BackgroundPrinter:
+    """Runs InfoPrinter.print on a daemon thread, off the control loop."""
+
+    def __init__(self, printer: print_info.InfoPrinter, maxsize: int = 16) -> None:
+        self.printer = printer
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.error: Exception | None = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            if self.error is not None:
+                # Keep draining so the control loop never blocks on a failed printer.
+                continue
+            try:
+                step, observation, action = item
+                self.printer.print(step, observation, action, raw_action=False)
+            except Exception as e:
+                self.error = e
+
+    def submit(self, step: int, observation: dict, action: torch.Tensor):
+        """Queue a print without blocking; re-raises an earlier printer error."""
+        self.raise_if_failed()
+        # Only the state is printed; copy it so the printer sees this step's values.
+        state = observation.get("observation.state")
+        observation = {} if state is None else {"observation.state": state.clone()}
+        try:
+            self.queue.put_nowait((step, observation, action.clone()))
+        except queue.Full:
+            # Never block the control loop on a slow printer; drop this step.
+            pass
+
+    def raise_if_failed(self):
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+        self.raise_if_failed()
 
 
 def inference_loop(
@@ -93,20 +156,19 @@ def inference_loop(
     robot_interface = RobotInterface(service_stub, cfg)
     model_to_action_trans = ActionTranslator(cfg)
 
-    dataloader = torch.utils.data.DataLoader(
-        dataset,
-        num_workers=4,
-        batch_size=1,
-        shuffle=False,
-        drop_last=True,
-    )
+    # Replay only needs the action and state columns. Reading them once from the
+    # underlying table avoids decoding every frame's videos just to get an action.
+    replay_table = dataset.hf_dataset.select_columns(
+        ["action", "observation.state"]
+    ).with_format("numpy")
+    num_frames = len(replay_table)
+    # One contiguous (T, action_dim) tensor; each step only takes a view of it.
+    actions = torch.from_numpy(np.ascontiguousarray(replay_table[:]["action"]))
+    start_state = replay_table[0]["observation.state"]
 
     step = 0
-    done = False
-
-    iterator = iter(dataloader)
-
-    batch = next(iterator)
+    # Frame 0 only provides the start pose; replay its successors like before.
+    frame_idx = 1
 
     observation = None
     while not observation:
@@ -117,8 +179,7 @@ def inference_loop(
     robot_interface.move_home()
 
     if model_to_action_trans.action_mode in (ActionMode.DELTA_TCP, ActionMode.ABS_TCP):
-        state = batch["observation.state"]
-        state = cfg.get_tcp_from_state(state[0].cpu().numpy())
+        state = cfg.get_tcp_from_state(start_state)
         # The robot expects the action to include gripper state as the last two elements.
         DEFAULT_GRIPPER_STATE = [0, 0]  # [gripper_position, gripper_velocity]
         action = np.concatenate([state, DEFAULT_GRIPPER_STATE]).astype(np.float32)
@@ -129,39 +190,52 @@ def inference_loop(
 
     input("Press Enter to continue...")
 
+    # Debug printing runs on a background thread to keep it off the control loop.
+    bg_printer = _BackgroundPrinter(dbg_printer)
+
     # Inference Loop
     print("Starting inference loop...")
-    period = 1.0 / replay_frequency
-    while not done:
-        start_time = time.time()
+    # Schedule ticks against absolute deadlines so loop overhead does not drift.
+    period_ns = int(1e9 / replay_frequency)
+    deadline_ns = time.monotonic_ns() + period_ns
+    while frame_idx < num_frames:
         observation = robot_interface.get_observation("cpu")
 
         if observation:
-            batch = next(iterator)
-
-            action = batch["action"]
+            # Keep the batch axis expected by the action translator.
+            action = actions[frame_idx : frame_idx + 1]
+            frame_idx += 1
 
             if ask_for_input:
                 input("Press Enter to send next action...")
 
             action = model_to_action_trans.translate(action, observation)
-            dbg_printer.print(step, observation, action, raw_action=False)
+            bg_printer.submit(step, observation, action)
 
             robot_interface.send_action(action, model_to_action_trans.action_mode)
             # policy._queues["action"].clear()
 
         # wait for execution to finish
-        elapsed_time = time.time() - start_time
-        sleep_duration = period - elapsed_time
+        sleep_duration = (deadline_ns - time.monotonic_ns()) / 1e9
 
         print(f"Sleep duration: {sleep_duration} s")
 
         # wait for input
         # input("Press Enter to continue...")
-        time.sleep(max(0.0, sleep_duration))
+        if sleep_duration > 0:
+            time.sleep(sleep_duration)
+            deadline_ns += period_ns
+        else:
+            # Missed the deadline (e.g. waiting for user input): resync instead of
+            # firing a burst of catch-up ticks.
+            deadline_ns = time.monotonic_ns() + period_ns
 
         step += 1
 
+    bg_printer.close()
+
+    print(f"Finished replaying {num_frames} frames of episode {ep_index}.")
+
 
 def main():
     parser = argparse.ArgumentParser(description="Robot service client")
@@ -0,0 +1,126 @@
+import json
+import math
+
+import pytest
+
+from example_policies.data_ops.merger import meta_manager
+from example_policies.data_ops.merger.meta_manager import load_jsonl, write_jsonl
+
+JSON_BACKENDS = ["orjson", "stdlib"]
+
+
+@pytest.fixture(params=JSON_BACKENDS)
+def json_backend(request, monkeypatch):
+    """Run a test once with orjson (if installed) and once with the stdlib path."""
+    if request.param == "orjson":
+        if meta_manager.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(meta_manager, "orjson", None)
+    return request.param
+
+
+class TestJsonlRoundTrip:
+    """Round-trip tests for the JSONL metadata helpers."""
+
+    def test_non_finite_floats(self, tmp_path, json_backend):
+        """NaN and Infinity must survive a write/load cycle, not become null."""
+        path = tmp_path / "stats.jsonl"
+        records = [
+            {"episode_index": 0, "stats": {"mean": [float("nan"), 1.5]}},
+            {"episode_index": 1, "stats": {"max": [float("inf"), -float("inf")]}},
+        ]
+        write_jsonl(records, path)
+        loaded = load_jsonl(path)
+
+        assert math.isnan(loaded[0]["stats"]["mean"][0])
+        assert loaded[0]["stats"]["mean"][1] == 1.5
+        assert loaded[1]["stats"]["max"] == [float("inf"), -float("inf")]
+
+    def test_non_ascii_strings(self, tmp_path, json_backend):
+        """Non-ASCII task names are preserved."""
+        path = tmp_path / "tasks.jsonl"
+        records = [{"task_index": 0, "task": "Lege den Würfel in die Schüssel ✓"}]
+        write_jsonl(records, path)
+        assert load_jsonl(path) == records
+
+    def test_loads_stdlib_written_file(self, tmp_path, json_backend):
+        """Files written by the stdlib json module, including NaN tokens, load."""
+        path = tmp_path / "episodes.jsonl"
+        records = [
+            {"episode_index": 0, "tasks": ["pick"], "length": 10},
+            {"episode_index": 1, "value": float("nan"), "task": "café"},
+        ]
+        with open(path, "w") as f:
+            for item in records:
+                f.write(json.dumps(item) + "\n")
+
+        loaded = load_jsonl(path)
+        assert loaded[0] == records[0]
+        assert math.isnan(loaded[1]["value"])
+        assert loaded[1]["task"] == "café"
+
+
+def _write_meta_dir(dataset_dir, episode_paths):
+    """Write a minimal meta/ directory with one frame per episode."""
+    meta_dir = dataset_dir / "meta"
+    meta_dir.mkdir(parents=True)
+    num_episodes = len(episode_paths)
+    files = {
+        "blacklist.json": [],
+        "episode_mapping.json": {str(i): p for i, p in enumerate(episode_paths)},
+        "pipeline_config.json": {},
+        "info.json": {
+            "total_episodes": num_episodes,
+            "total_frames": num_episodes,
+            "total_videos": num_episodes,
+            "total_tasks": 1,
+            "splits": {"train": f"0:{num_episodes}"},
+        },
+    }
+    for name, data in files.items():
+        with open(meta_dir / name, "w") as f:
+            json.dump(data, f)
+
+    meta_manager.write_jsonl(
+        [{"episode_index": i, "length": 1} for i in range(num_episodes)],
+        meta_dir / "episodes.jsonl",
+    )
+    meta_manager.write_jsonl(
+        [{"episode_index": i, "stats": {}} for i in range(num_episodes)],
+        meta_dir / "episodes_stats.jsonl",
+    )
+    meta_manager.write_jsonl(
+        [{"task_index": 0, "task": "pick"}], meta_dir / "tasks.jsonl"
+    )
+
+
+class TestEpisodeMapping:
+    """Tests for the int-keyed in-memory episode mapping."""
+
+    def test_load_merge_save_round_trip(self, tmp_path):
+        """Keys are ints in memory, offsets apply, and the file keeps str keys."""
+        _write_meta_dir(tmp_path / "a", ["a0.mcap", "a1.mcap"])
+        _write_meta_dir(tmp_path / "b", ["b0.mcap"])
+
+        dataset_a = meta_manager.MetaManager()
+        dataset_a.load_from_files(tmp_path / "a")
+        dataset_b = meta_manager.MetaManager()
+        dataset_b.load_from_files(tmp_path / "b")
+        assert dataset_a.episode_mapping == {0: "a0.mcap", 1: "a1.mcap"}
+
+        merged = meta_manager.MetaManager()
+        merged.add_meta(dataset_a, episode_offset=0, task_map={"pick": 0})
+        merged.add_meta(dataset_b, episode_offset=2, task_map={"pick": 0})
+
+        assert merged.episode_mapping == {0: "a0.mcap", 1: "a1.mcap", 2: "b0.mcap"}
+        assert all(isinstance(idx, int) for idx in merged.episode_mapping)
+
+        merged.save(tmp_path / "merged")
+        with open(tmp_path / "merged" / "meta" / "episode_mapping.json") as f:
+            on_disk = json.load(f)
+        assert on_disk == {"0": "a0.mcap", "1": "a1.mcap", "2": "b0.mcap"}
+
+        reloaded = meta_manager.MetaManager()
+        reloaded.load_from_files(tmp_path / "merged")
+        assert reloaded.episode_mapping == merged.episode_mapping